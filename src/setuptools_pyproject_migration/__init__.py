@@ -6,7 +6,7 @@ import setuptools
 import sys
 import tomlkit
 from packaging.specifiers import SpecifierSet
-from pep508_parser import parser as pep508
+from packaging.utils import canonicalize_name
 from setuptools.errors import OptionError
 from setuptools_pyproject_migration._long_description import LongDescriptionMetadata
 from setuptools_pyproject_migration._types import Contributor, Pyproject
@@ -17,6 +17,42 @@ from typing import Dict, List, Optional, Set, Tuple, TypeVar, Union
 _logger = logging.getLogger("setuptools_pyproject_migration")
 
 
+# The distribution name at the start of a PEP 508 requirement string
+_REQUIREMENT_NAME_REGEX = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+def _requirement_name(requirement: str) -> Optional[str]:
+    """
+    Return the normalized name of the distribution referred to by a PEP 508
+    requirement string.
+
+    >>> _requirement_name("setuptools")
+    'setuptools'
+    >>> _requirement_name("  SetupTools >= 40")
+    'setuptools'
+    >>> _requirement_name("setuptools_scm[toml]>=3.4.1")
+    'setuptools-scm'
+
+    This only looks at the name, so it doesn't check that the rest of the
+    string is a valid requirement.
+
+    >>> _requirement_name("setuptools; python_version < '3.12'")
+    'setuptools'
+    >>> _requirement_name(">=40") is None
+    True
+
+    :param: requirement A requirement string, as found in ``setup_requires``
+                        or ``install_requires``.
+    :returns:           The name of the required distribution, normalized as
+                        per :py:func:`packaging.utils.canonicalize_name`, or
+                        ``None`` if the string doesn't start with a name.
+    """
+    match = _REQUIREMENT_NAME_REGEX.match(requirement)
+    if not match:
+        return None
+    return canonicalize_name(match.group(1))
+
+
 def _parse_entry_point(entry_point: str) -> Tuple[str, str]:
     """
     Extract the entry point and name from the string.
@@ -38,10 +74,10 @@ def _parse_entry_point(entry_point: str) -> Tuple[str, str]:
                         (module and function name) as a string.
     :raises ValueError: An equals (`=`) character was not present in the entry point string.
     """
-    if "=" not in entry_point:
+    (name, sep, target) = entry_point.partition("=")
+    if not sep:
         raise ValueError("Entry point %r is not of the form 'name = module:function'" % entry_point)
 
-    (name, target) = entry_point.split("=", 1)
     return (name.strip(), target.strip())
 
 
@@ -145,7 +181,9 @@ _MEDIA_TYPE_REGEX = re.compile(
                                                 # but we see it in practice)
         [A-Za-z0-9][A-Za-z0-9!#$&^_.+-]{,126}   # RFC 2045 attribute
         =
-        (?:[^\s]+|"[^"]+")                      # RFC 2045 value
+        (?:[^\s";]+|"[^"]*")                    # RFC 2045 value (an unquoted value can't contain
+                                                # a quote or semicolon, which also keeps this from
+                                                # backtracking exponentially on a long invalid string)
     )*
     """,
     re.VERBOSE,
@@ -179,9 +217,20 @@ def _looks_like_media_type(value: str) -> bool:
 
     >>> _looks_like_media_type("text/markdown; charset=iso-8859-1; variant=GFM")
     True
+
+    Long strings that aren't media types are rejected in linear time.
+
+    >>> _looks_like_media_type("text/plain" + ";a=b" * 1000 + " ")
+    False
     """
 
-    return bool(_MEDIA_TYPE_REGEX.fullmatch(value))
+    # Anything without a slash can be rejected without running the regex
+    return "/" in value and _MEDIA_TYPE_REGEX.fullmatch(value) is not None
+
+
+# A comma separating the entries in a list-valued setuptools option, along with
+# any whitespace around it
+_LIST_SEPARATOR_REGEX = re.compile(r"\s*,\s*")
 
 
 class WritePyproject(setuptools.Command):
@@ -206,25 +255,6 @@ class WritePyproject(setuptools.Command):
                 f"error in readme_content_type option: {self.readme_content_type} is not a valid content type"
             )
 
-    @staticmethod
-    def _strip_and_canonicalize(s: str) -> str:
-        """
-        Strip whitespace from around a string, but replace the sentinel value
-        ``"UNKNOWN"`` (used by setuptools<62.2) with an empty string.
-
-        >>> WritePyproject._strip_and_canonicalize("        ooh, you lucky bastard")
-        'ooh, you lucky bastard'
-        >>> WritePyproject._strip_and_canonicalize("UNKNOWN")
-        ''
-        >>> WritePyproject._strip_and_canonicalize("")
-        ''
-        """
-        s = s.strip()
-        if s == "UNKNOWN":
-            return ""
-        else:
-            return s
-
     @staticmethod
     def _transform_contributors(name_string: Optional[str], email_string: Optional[str]) -> List[Contributor]:
         """
@@ -240,6 +270,12 @@ class WritePyproject(setuptools.Command):
         >>> WritePyproject._transform_contributors("John Cleese, Graham Chapman", "john@python.example.com")
         [{'name': 'John Cleese', 'email': 'john@python.example.com'}, {'name': 'Graham Chapman'}]
 
+        The sentinel value ``"UNKNOWN"`` (used by setuptools<62.2) is treated
+        the same as an empty entry.
+
+        >>> WritePyproject._transform_contributors("UNKNOWN", "UNKNOWN")
+        []
+
         :param: name_string  A string giving a comma-separated list of contributor
                              names.
         :param: email_string A string giving a comma-separated list of contributor
@@ -247,14 +283,19 @@ class WritePyproject(setuptools.Command):
         :returns:            A list of dicts containing corresponding names and
                              email addresses parsed from the strings.
         """
-        names = map(WritePyproject._strip_and_canonicalize, (name_string or "").split(","))
-        emails = map(WritePyproject._strip_and_canonicalize, (email_string or "").split(","))
+        if not (name_string or email_string):
+            return []
+
+        # Splitting on the separator regex strips the whitespace from around
+        # each entry, so only the ends of the whole string need stripping
+        names = _LIST_SEPARATOR_REGEX.split((name_string or "").strip())
+        emails = _LIST_SEPARATOR_REGEX.split((email_string or "").strip())
         contributors = []
         for name, email in itertools.zip_longest(names, emails, fillvalue=""):
             contributor: Contributor = {}
-            if name:
+            if name and name != "UNKNOWN":
                 contributor["name"] = name
-            if email:
+            if email and email != "UNKNOWN":
                 contributor["email"] = email
             if contributor:
                 contributors.append(contributor)
@@ -274,7 +315,7 @@ class WritePyproject(setuptools.Command):
         setup_requirements = set(dist.setup_requires)
 
         # Is 'setuptools' already there?
-        has_setuptools = any(pep508.parse(dep)[0] == "setuptools" for dep in setup_requirements)
+        has_setuptools = any(_requirement_name(dep) == "setuptools" for dep in setup_requirements)
 
         if not has_setuptools:
             # We will need it here
@@ -362,13 +403,13 @@ class WritePyproject(setuptools.Command):
             else:
                 _logger.debug("Adding to dependencies")
                 target = dependencies
-            for dep in deps:
-                if constraint:
-                    _logger.debug("Adding dependency %s with constraint %r", dep, constraint)
-                    target.add(f"{dep}; {constraint}")
-                else:
-                    _logger.debug("Adding dependency %s with no constraint", dep)
-                    target.add(dep)
+            if constraint:
+                _logger.debug("Adding dependencies %r with constraint %r", deps, constraint)
+                suffix = f"; {constraint}"
+                target.update(dep + suffix for dep in deps)
+            else:
+                _logger.debug("Adding dependencies %r with no constraint", deps)
+                target.update(deps)
 
         if dependencies:
             # NB: ensure a consistent alphabetical ordering of dependencies
@@ -8,6 +8,7 @@ import logging
 import mimetypes
 import pathlib
 import setuptools.dist
+import stat
 import warnings
 
 from setuptools_pyproject_migration._types import ReadmeFile, ReadmeText
@@ -143,7 +144,9 @@ def _read_long_description_file(path: pathlib.Path) -> str:
     Read the content of the long description from a filename.
     """
     # TODO handle multiple comma-separated filenames
-    return path.read_text()
+    # setuptools reads files named in file: directives as UTF-8 regardless of
+    # the locale, so we do the same
+    return path.read_text(encoding="utf-8")
 
 
 def _guess_path(
@@ -206,11 +209,41 @@ def _guess_path_from_content(long_description: str) -> Optional[pathlib.Path]:
     """
     for filename in glob.glob("README.*") + ["README"]:
         path = pathlib.Path(filename)
-        if path.exists() and path.read_text() == long_description:
-            return path
+        try:
+            path_stat = path.stat()
+        except FileNotFoundError:
+            continue
+        # Every character takes up at least one byte in the file, so a file
+        # smaller than that can't match and doesn't need to be read
+        if not stat.S_ISREG(path_stat.st_mode) or path_stat.st_size < len(long_description):
+            continue
+        try:
+            if path.read_text() == long_description:
+                return path
+        except UnicodeDecodeError:
+            # Not a text file, e.g. README.png
+            continue
     return None
 
 
+_README_EXTENSIONS = {
+    # .md and .rst are called out specifically in the packaging specification
+    # https://packaging.python.org/en/latest/specifications/declaring-project-metadata/#readme
+    "text/markdown": ".md",
+    "text/x-rst": ".rst",
+    # Python <3.8 returns an arbitrary one from among all extensions associated
+    # with the content type, so we override it to return the most likely one for
+    # common README content types
+    # - https://github.com/python/cpython/issues/40993
+    # - https://github.com/python/cpython/issues/51048
+    "text/plain": ".txt",
+}
+"""
+File extensions for common README content types, which take precedence over
+whatever :py:mod:`mimetypes` would choose.
+"""
+
+
 def _guess_readme_extension(content_type: str) -> Optional[str]:
     """
     Return the file extension that most canonically implies the given content
@@ -240,21 +273,12 @@ def _guess_readme_extension(content_type: str) -> Optional[str]:
     '.rst'
     >>> _guess_readme_extension("text/plain; charset=utf-8")
     '.txt'
+    >>> _guess_readme_extension("text/markdown ; charset=utf-8")
+    '.md'
     """  # noqa: E501
 
-    content_type = content_type.lower().partition(";")[0]
-    # .md and .rst are called out specifically in the packaging specification
-    # https://packaging.python.org/en/latest/specifications/declaring-project-metadata/#readme
-    if content_type == "text/markdown":
-        return ".md"
-    elif content_type == "text/x-rst":
-        return ".rst"
-    # Python <3.8 returns an arbitrary one from among all extensions associated
-    # with the content type, so we override it to return the most likely one for
-    # common README content types
-    # - https://github.com/python/cpython/issues/40993
-    # - https://github.com/python/cpython/issues/51048
-    elif content_type == "text/plain":
-        return ".txt"
-    else:
+    content_type = content_type.lower().partition(";")[0].strip()
+    try:
+        return _README_EXTENSIONS[content_type]
+    except KeyError:
         return mimetypes.guess_extension(content_type)
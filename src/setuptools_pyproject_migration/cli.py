@@ -4,9 +4,17 @@ A simple command-line interface to the plugin.
 
 import argparse
 import os.path
+import runpy
 import sys
+import types
 import warnings
 
+# The code to run in place of setup.py when the project doesn't have one. It
+# never changes, so it's compiled once here rather than on every call to main()
+_STUB_SETUP_PY_CODE: types.CodeType = compile(
+    "import setuptools\nsetuptools.setup()\n", "setup.py", "exec", dont_inherit=True
+)
+
 
 def _parse_args() -> argparse.Namespace:
     parser: argparse.ArgumentParser = argparse.ArgumentParser(
@@ -57,14 +65,14 @@ def main() -> None:
 
     sys.argv = ["setup.py", "pyproject"]
 
-    setup_code: str
     if os.path.exists("setup.py"):
-        with open("setup.py") as f:
-            setup_code = f.read()
+        # Run setup.py as the main module, the same as `python setup.py` does,
+        # so scripts that guard their setup() call with
+        # `if __name__ == "__main__":` or use __file__ work. runpy also decodes
+        # the file the way Python does, honoring any coding declaration.
+        runpy.run_path("setup.py", run_name="__main__")
     else:
-        setup_code = "import setuptools\nsetuptools.setup()\n"
-    setup_bytecode = compile(setup_code, "setup.py", "exec", dont_inherit=True)
-    exec(setup_bytecode)
+        exec(_STUB_SETUP_PY_CODE)
 
 
 def old_main() -> None:
@@ -43,6 +43,28 @@ def test_guess_path_with_file(project):
     assert result == readme_path
 
 
+def test_guess_path_with_directory(project):
+    readme_path = pathlib.Path("README.txt")
+    description = "This is a long description"
+    (project.root / "README.d").mkdir()
+    project.write(readme_path, description)
+    project.setup_py()
+    distribution: setuptools.dist.Distribution = project.distribution()
+    result = _guess_path(distribution, description, "text/plain")
+    assert result == readme_path
+
+
+def test_guess_path_with_binary_file(project):
+    readme_path = pathlib.Path("README.txt")
+    description = "This is a long description"
+    (project.root / "README.png").write_bytes(b"\x89PNG\r\n\x1a\n" + b"\xff" * 64)
+    project.write(readme_path, description)
+    project.setup_py()
+    distribution: setuptools.dist.Distribution = project.distribution()
+    result = _guess_path(distribution, description, "text/plain")
+    assert result == readme_path
+
+
 @pytest.mark.parametrize(
     ["text", "content_type", "path", "expected"],
     [
@@ -282,3 +282,31 @@ ep2 = "test_project.ep2"
     project.write("README.md", readme_md)
     result = runner(console_script_project_runner)
     check_result(result, pyproject_toml)
+
+
+def test_main_guard(project, console_script_project_runner: ProjectRunner) -> None:
+    """
+    Test that the console script runs setup.py as the main module, so a script
+    which only calls setup() under ``if __name__ == "__main__":`` is handled the
+    same way as when it's run directly.
+    """
+    setup_py = """\
+import setuptools
+
+if __name__ == "__main__":
+    setuptools.setup(name="test-project", version="0.0.1")
+"""
+    pyproject_toml = """\
+[build-system]
+requires = ["setuptools"]
+build-backend = "setuptools.build_meta"
+
+[project]
+name = "test-project"
+version = "0.0.1"
+"""
+    project.setup_py(setup_py)
+    # Running setup.py directly always sets __name__ to "__main__", so this
+    # serves as a control for the console script
+    check_result(project.run(console_script_project_runner), pyproject_toml)
+    check_result(project.run_cli(console_script_project_runner), pyproject_toml)
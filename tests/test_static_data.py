@@ -169,6 +169,37 @@ setup_requires =
     assert result == pyproject
 
 
+def test_setup_requires_setuptools_unnormalized(project) -> None:
+    """
+    Test that we recognize 'setuptools' in build requirements even if its name
+    is not written in normalized form
+    """
+    setup_cfg = """\
+[metadata]
+name = test-project
+version = 0.0.1
+
+[options]
+setup_requires =
+        SetupTools>=34.56
+        sphinx
+"""
+    pyproject = {
+        "build-system": {
+            "requires": ["SetupTools>=34.56", "sphinx"],
+            "build-backend": "setuptools.build_meta",
+        },
+        "project": {
+            "name": "test-project",
+            "version": "0.0.1",
+        },
+    }
+    project.setup_cfg(setup_cfg)
+    project.setup_py()
+    result = project.generate()
+    assert result == pyproject
+
+
 def test_description(make_write_pyproject) -> None:
     description = "Description of TestProject"
 